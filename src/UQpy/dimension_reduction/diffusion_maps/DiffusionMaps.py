@@ -15,7 +15,7 @@ from UQpy.utilities.Utilities import _nn_coord
 from beartype import beartype
 from typing import Annotated, Union
 from beartype.vale import Is
-from UQpy.utilities.ValidationTypes import Numpy2DFloatArray, NumpyFloatArray
+from UQpy.utilities.ValidationTypes import Numpy2DFloatArray, NumpyFloatArray, RandomStateType
 from UQpy.utilities.kernels.baseclass.Kernel import Kernel
 
 
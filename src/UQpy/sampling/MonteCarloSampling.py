@@ -2,7 +2,7 @@ from typing import Union
 from typing import Optional
 from beartype import beartype
 
-from UQpy.utilities.ValidationTypes import RandomStateType, PositiveInteger, NumpyFloatArray
+from UQpy.utilities.ValidationTypes import RandomGeneratorType, PositiveInteger, NumpyFloatArray
 from UQpy.distributions import *
 from UQpy.utilities.Utilities import process_random_state
 import numpy as np
@@ -16,7 +16,7 @@ class MonteCarloSampling:
         self,
         distributions: Union[Distribution, list[Distribution]],
         nsamples: Optional[int] = None,
-        random_state: RandomStateType = None,
+        random_state: RandomGeneratorType = None,
     ):
         """
         Perform Monte Carlo sampling (MCS) of random variables.
@@ -27,7 +27,8 @@ class MonteCarloSampling:
          then the :class:`.MonteCarloSampling` object is created but samples are not generated.
         :param random_state: Random seed used to initialize the pseudo-random number generator. If an :any:`int` is
          provided, this sets the seed for an object of :class:`numpy.random.RandomState`. Otherwise, the
-         object itself can be passed directly.
+         object itself can be passed directly. A :class:`numpy.random.Generator` is also accepted and is passed
+         directly to the :meth:`rvs` method of the distributions.
         """
         self.logger = logging.getLogger(__name__)
         self.random_state = process_random_state(random_state)
@@ -51,7 +52,6 @@ class MonteCarloSampling:
         If a list of mixed :class:`.DistributionContinuous1D` and :class:`.DistributionContinuousND` objects is provided
         then `samples` is a list with ``len(samples)=nsamples`` and ``len(samples[i]) = len(distributions)``.
         """
-        self.x = None
         self.samplesU01: NumpyFloatArray = None
         """
         Generated samples transformed to the unit hypercube.
@@ -100,7 +100,7 @@ class MonteCarloSampling:
             self.array = True
 
     @beartype
-    def run(self, nsamples: PositiveInteger, random_state: RandomStateType = None):
+    def run(self, nsamples: PositiveInteger, random_state: RandomGeneratorType = None):
         """
         Execute the random sampling in the :class:`.MonteCarloSampling` class.
 
@@ -121,36 +121,49 @@ class MonteCarloSampling:
 
         self.logger.info("UQpy: Running Monte Carlo Sampling.")
 
-        if isinstance(self.dist_object, list):
+        if isinstance(self.dist_object, list) and self.array is True:
+            # One column per univariate distribution.
+            new_samples = np.concatenate([np.reshape(self._draw_samples(distribution, nsamples, self.random_state),
+                                                     (nsamples, -1)) for distribution in self.dist_object], axis=1)
+        elif isinstance(self.dist_object, list):
             temp_samples = []
             for i in range(len(self.dist_object)):
                 if hasattr(self.dist_object[i], "rvs"):
                     temp_samples.append(self.dist_object[i].rvs(nsamples=nsamples, random_state=self.random_state))
                 else:
                     raise ValueError("UQpy: rvs method is missing.")
-            self.x = []
-            for j in range(nsamples):
-                y = [temp_samples[k][j] for k in range(len(self.dist_object))]
-                self.x.append(np.array(y))
+            new_samples = np.array([np.array([samples[j] for samples in temp_samples]) for j in range(nsamples)])
         elif hasattr(self.dist_object, "rvs"):
-            temp_samples = self.dist_object.rvs(nsamples=nsamples, random_state=self.random_state)
-            self.x = temp_samples
+            new_samples = np.asarray(self.dist_object.rvs(nsamples=nsamples, random_state=self.random_state))
+        else:
+            raise ValueError("UQpy: rvs method is missing.")
 
         if self.samples is None:
-            if isinstance(self.dist_object, list) and self.array is True:
-                self.samples = np.hstack(np.array(self.x)).T
-            else:
-                self.samples = np.array(self.x)
-        elif isinstance(self.dist_object, list) and self.array is True:
-            self.samples = np.concatenate([self.samples, np.hstack(np.array(self.x)).T], axis=0)
-        elif isinstance(self.dist_object, Distribution):
-            self.samples = np.vstack([self.samples, self.x])
+            self.samples = new_samples
         else:
-            self.samples = np.vstack([self.samples, self.x])
+            self.samples = np.concatenate([self.samples, new_samples], axis=0)
         self.nsamples = len(self.samples)
 
         self.logger.info("UQpy: Monte Carlo Sampling Complete.")
 
+    @staticmethod
+    def _draw_samples(distribution, nsamples, random_state):
+        if not hasattr(distribution, "rvs"):
+            raise ValueError("UQpy: rvs method is missing.")
+        if type(distribution) not in (Normal, Uniform):
+            return distribution.rvs(nsamples=nsamples, random_state=random_state)
+
+        loc, scale = distribution.parameters["loc"], distribution.parameters["scale"]
+        if loc is None or scale is None or scale <= 0:
+            # scipy.stats reports the invalid parameters
+            return distribution.rvs(nsamples=nsamples, random_state=random_state)
+
+        # Normal and Uniform samples are drawn directly from the random state, bypassing the scipy.stats dispatch.
+        # The samples are identical to the ones of scipy.stats.norm.rvs and scipy.stats.uniform.rvs.
+        draws = (random_state.standard_normal(nsamples) if type(distribution) is Normal
+                 else random_state.uniform(0.0, 1.0, nsamples))
+        return (draws * scale + loc).reshape((nsamples, 1))
+
     def transform_u01(self):
         """
         Transform random samples to uniform on the unit hypercube.
@@ -160,13 +173,11 @@ class MonteCarloSampling:
         """
         if isinstance(self.dist_object, list) and self.array is True:
             zi = np.zeros_like(self.samples)
-            for i in range(self.nsamples):
-                z = self.samples[i, :]
-                for j in range(len(self.dist_object)):
-                    if hasattr(self.dist_object[j], "cdf"):
-                        zi[i, j] = self.dist_object[j].cdf(z[j])
-                    else:
-                        raise ValueError("UQpy: All distributions must have a cdf method.")
+            for j in range(len(self.dist_object)):
+                if hasattr(self.dist_object[j], "cdf"):
+                    zi[:, j] = self.dist_object[j].cdf(self.samples[:, j])
+                else:
+                    raise ValueError("UQpy: All distributions must have a cdf method.")
             self.samplesU01 = zi
 
         elif isinstance(self.dist_object, Distribution):
@@ -174,9 +185,16 @@ class MonteCarloSampling:
                 raise ValueError("UQpy: All distributions must have a cdf method.")
 
             zi = np.zeros_like(self.samples)
-            for i in range(self.nsamples):
-                z = self.samples[i, :]
-                zi[i, :] = self.dist_object.cdf(z)
+            if isinstance(self.dist_object, Distribution1D):
+                zi[:] = np.reshape(self.dist_object.cdf(self.samples), (self.nsamples, -1))
+            elif isinstance(self.dist_object, JointIndependent):
+                # One column per marginal.
+                for j, marginal in enumerate(self.dist_object.marginals):
+                    zi[:, j] = marginal.cdf(self.samples[:, j])
+            else:
+                for i in range(self.nsamples):
+                    z = self.samples[i, :]
+                    zi[i, :] = self.dist_object.cdf(z)
             self.samplesU01 = zi
         elif isinstance(self.dist_object, list) and self.list is True:
             temp_samples_u01 = []
@@ -157,7 +157,7 @@ class GeneralisedSobolSensitivity(Sensitivity):
             model_evals = self._run_model(C_i)
 
             if model_evals.ndim == 3:
-                C_i_model_evals[:, :, i] = self._run_model(C_i)[:, :, 0].T
+                C_i_model_evals[:, :, i] = model_evals[:, :, 0].T
             else:
                 C_i_model_evals[:, :, i] = model_evals.T
 
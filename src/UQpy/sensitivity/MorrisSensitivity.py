@@ -193,14 +193,12 @@ class MorrisSensitivity:
         trajectories_unit_hypercube[trajectories_unit_hypercube < 0.01] = 0.01
         trajectories_unit_hypercube[trajectories_unit_hypercube > 0.99] = 0.99
 
-        # Transform to physical space via icdf
-        trajectories_physical_space = []
-        for trajectory_uh in trajectories_unit_hypercube:
-            trajectory_ps = np.zeros_like(trajectory_uh)
-            for count_d, (design_d, icdf_d) in enumerate(zip(trajectory_uh.T, self.icdfs)):
-                trajectory_ps[:, count_d] = icdf_d(x=design_d)
-            trajectories_physical_space.append(trajectory_ps)
-        trajectories_physical_space = np.array(trajectories_physical_space)
+        # Transform to physical space via icdf, one call per marginal for all trajectories
+        designs_uh = trajectories_unit_hypercube.reshape(-1, self.dimension)
+        trajectories_physical_space = np.zeros_like(designs_uh)
+        for count_d, icdf_d in enumerate(self.icdfs):
+            trajectories_physical_space[:, count_d] = icdf_d(x=designs_uh[:, count_d])
+        trajectories_physical_space = trajectories_physical_space.reshape(trajectories_unit_hypercube.shape)
         return trajectories_unit_hypercube, trajectories_physical_space
 
     def _compute_elementary_effects(self, trajectories_physical_space):
@@ -520,53 +520,41 @@ def compute_first_order(
     n_outputs = A_model_evals.shape[1]
     num_vars = C_i_model_evals.shape[2]
 
-    # Store first order Sobol' indices
-    first_order_sobol = np.zeros((num_vars, n_outputs))
+    # <f_A, f_C_i>/N for all variables and outputs at once.
+    # Shape: `(num_vars, n_outputs)`
+    A_dot_C_i = np.einsum("no,onv->vo", A_model_evals, C_i_model_evals) / n_samples
 
     if scheme == "Sobol1993":
 
-        for output_j in range(n_outputs):
-
-            f_A = A_model_evals[:, output_j]
-            f_B = B_model_evals[:, output_j] if B_model_evals is not None else None
-
-            # combine all model evaluations
-            # to improve accuracy of the estimator
-            _all_model_evals = np.append(f_A, f_B) if f_B is not None else f_A
-            f_0 = np.mean(_all_model_evals)  # scalar
-
-            f_0_square = f_0**2
-            total_variance = np.var(_all_model_evals, ddof=1)
-
-            for var_i in range(num_vars):
-
-                f_C_i = C_i_model_evals[output_j, :, var_i]
+        # combine all model evaluations
+        # to improve accuracy of the estimator
+        _all_model_evals = (
+            np.concatenate([A_model_evals, B_model_evals], axis=0)
+            if B_model_evals is not None
+            else A_model_evals
+        )
+        f_0 = np.mean(_all_model_evals, axis=0)  # Shape: `(n_outputs,)`
 
-                S_i = (np.dot(f_A, f_C_i) / n_samples - f_0_square) / total_variance
+        f_0_square = f_0**2
+        total_variance = np.var(_all_model_evals, axis=0, ddof=1)
 
-                first_order_sobol[var_i, output_j] = S_i
+        first_order_sobol = (A_dot_C_i - f_0_square) / total_variance
 
     elif scheme == "Janon2014":
 
-        for output_j in range(n_outputs):
-
-            f_A = A_model_evals[:, output_j]
-
-            for var_i in range(num_vars):
-
-                f_C_i = C_i_model_evals[output_j, :, var_i]
-
-                # combine all model evaluations
-                # to improve accuracy of the estimator
-                _all_model_evals = np.append(f_A, f_C_i)
-                f_0 = np.mean(_all_model_evals)
-
-                f_0_square = f_0**2
-                total_variance = np.mean(_all_model_evals**2) - f_0_square
+        # combine all model evaluations of f_A and f_C_i
+        # to improve accuracy of the estimator
+        # Shape: `(num_vars, n_outputs)`
+        f_0 = (np.sum(A_model_evals, axis=0) + np.sum(C_i_model_evals, axis=1).T) / (
+            2 * n_samples
+        )
 
-                S_i = (np.dot(f_A, f_C_i) / n_samples - f_0_square) / total_variance
+        f_0_square = f_0**2
+        total_variance = (
+            np.sum(A_model_evals**2, axis=0) + np.sum(C_i_model_evals**2, axis=1).T
+        ) / (2 * n_samples) - f_0_square
 
-                first_order_sobol[var_i, output_j] = S_i
+        first_order_sobol = (A_dot_C_i - f_0_square) / total_variance
 
     elif scheme == "Saltelli2002":
 
@@ -576,54 +564,52 @@ def compute_first_order(
 
         """
 
-        for output_j in range(n_outputs):
-
-            f_A = A_model_evals[:, output_j]
-            f_B = B_model_evals[:, output_j]
-            f_0_square = np.dot(f_A, f_B) / n_samples
-            total_variance = np.var(f_A, ddof=1)
+        f_0_square = np.sum(A_model_evals * B_model_evals, axis=0) / n_samples
+        total_variance = np.var(A_model_evals, axis=0, ddof=1)
 
-            for var_i in range(num_vars):
+        # (Estimate 1)
+        est_1 = (A_dot_C_i - f_0_square) / total_variance
 
-                f_C_i = C_i_model_evals[output_j, :, var_i]
-                f_D_i = D_i_model_evals[output_j, :, var_i]
+        # (Estimate 2)
+        B_dot_D_i = np.einsum("no,onv->vo", B_model_evals, D_i_model_evals) / n_samples
+        est_2 = (B_dot_D_i - f_0_square) / total_variance
 
-                # (Estimate 1)
-                est_1 = (np.dot(f_A, f_C_i) / n_samples - f_0_square) / total_variance
+        if num_vars == 3:
 
-                # (Estimate 2)
-                est_2 = (np.dot(f_B, f_D_i) / n_samples - f_0_square) / total_variance
+            # remaining pair of variables for each var_i,
+            # i.e. (1, 2), (0, 2) and (0, 1)
+            var_a, var_b = [1, 0, 0], [2, 2, 1]
 
-                if num_vars == 3:
-
-                    # list of variable indices
-                    list_vars = list(range(num_vars))
-                    list_vars.remove(var_i)
-                    # combination of all remaining variables indices
-                    rem_vars_perm = list(itertools.permutations(list_vars, 2))
-
-                    # (Estimate 3)
-                    var_a, var_b = rem_vars_perm[0]
-                    f_C_a = C_i_model_evals[output_j, :, var_a]
-                    f_C_b = C_i_model_evals[output_j, :, var_b]
-                    est_3 = (
-                        np.dot(f_C_a, f_C_b) / n_samples - f_0_square
-                    ) / total_variance
+            # (Estimate 3)
+            C_a_dot_C_b = (
+                np.einsum(
+                    "onv,onv->vo",
+                    C_i_model_evals[:, :, var_a],
+                    C_i_model_evals[:, :, var_b],
+                )
+                / n_samples
+            )
+            est_3 = (C_a_dot_C_b - f_0_square) / total_variance
+
+            # (Estimate 4)
+            D_a_dot_D_b = (
+                np.einsum(
+                    "onv,onv->vo",
+                    D_i_model_evals[:, :, var_a],
+                    D_i_model_evals[:, :, var_b],
+                )
+                / n_samples
+            )
+            est_4 = (D_a_dot_D_b - f_0_square) / total_variance
 
-                    # (Estimate 4)
-                    var_a, var_b = rem_vars_perm[1]
-                    f_D_a = D_i_model_evals[output_j, :, var_a]
-                    f_D_b = D_i_model_evals[output_j, :, var_b]
-                    est_4 = (
-                        np.dot(f_D_a, f_D_b) / n_samples - f_0_square
-                    ) / total_variance
+            first_order_sobol = (est_1 + est_2 + est_3 + est_4) / 4
 
-                    first_order_sobol[var_i, output_j] = (
-                        est_1 + est_2 + est_3 + est_4
-                    ) / 4
+        else:
+            first_order_sobol = (est_1 + est_2) / 2
 
-                else:
-                    first_order_sobol[var_i, output_j] = (est_1 + est_2) / 2
+    else:
+        # unknown scheme
+        first_order_sobol = np.zeros((num_vars, n_outputs))
 
     return first_order_sobol
 
@@ -672,63 +658,47 @@ def compute_total_order(
 
     """
 
-    n_samples = A_model_evals.shape[0]
-    n_outputs = A_model_evals.shape[1]
+    n_samples = B_model_evals.shape[0]
+    n_outputs = B_model_evals.shape[1]
     num_vars = C_i_model_evals.shape[2]
 
-    # Store total order Sobol' indices
-    total_order_sobol = np.zeros((num_vars, n_outputs))
+    # <f_B, f_C_i>/N for all variables and outputs at once.
+    # Shape: `(num_vars, n_outputs)`
+    B_dot_C_i = np.einsum("no,onv->vo", B_model_evals, C_i_model_evals) / n_samples
 
     if scheme == "Homma1996":
 
-        for output_j in range(n_outputs):
-
-            f_A = A_model_evals[:, output_j] if A_model_evals is not None else None
-            f_B = B_model_evals[:, output_j]
-
-            # combine all model evaluations
-            # to improve accuracy of the estimator
-            _all_model_evals = np.append(f_A, f_B) if f_A is not None else f_B
-            f_0 = np.mean(_all_model_evals)  # scalar
-
-            f_0_square = f_0**2
-            total_variance = np.var(_all_model_evals, ddof=1)
-
-            for var_i in range(num_vars):
-
-                f_C_i = C_i_model_evals[output_j, :, var_i]
+        # combine all model evaluations
+        # to improve accuracy of the estimator
+        _all_model_evals = (
+            np.concatenate([A_model_evals, B_model_evals], axis=0)
+            if A_model_evals is not None
+            else B_model_evals
+        )
+        f_0 = np.mean(_all_model_evals, axis=0)  # Shape: `(n_outputs,)`
 
-                S_T_i = (
-                    1 - (np.dot(f_B, f_C_i) / n_samples - f_0_square) / total_variance
-                )
+        f_0_square = f_0**2
+        total_variance = np.var(_all_model_evals, axis=0, ddof=1)
 
-                total_order_sobol[var_i, output_j] = S_T_i
+        total_order_sobol = 1 - (B_dot_C_i - f_0_square) / total_variance
 
     elif scheme == "Saltelli2002":
 
-        for output_j in range(n_outputs):
-
-            f_A = A_model_evals[:, output_j]
-            f_B = B_model_evals[:, output_j]
-            f_0_square = np.mean(f_B) ** 2
-            total_variance = np.var(f_B, ddof=1)
+        f_0_square = np.mean(B_model_evals, axis=0) ** 2
+        total_variance = np.var(B_model_evals, axis=0, ddof=1)
 
-            for var_i in range(num_vars):
+        # (Estimate 1)
+        est_1 = 1 - (B_dot_C_i - f_0_square) / total_variance
 
-                f_C_i = C_i_model_evals[output_j, :, var_i]
-                f_D_i = D_i_model_evals[output_j, :, var_i]
+        # (Estimate 2)
+        A_dot_D_i = np.einsum("no,onv->vo", A_model_evals, D_i_model_evals) / n_samples
+        est_2 = 1 - (A_dot_D_i - f_0_square) / total_variance
 
-                # (Estimate 1)
-                est_1 = (
-                    1 - (np.dot(f_B, f_C_i) / n_samples - f_0_square) / total_variance
-                )
-
-                # (Estimate 2)
-                est_2 = (
-                    1 - (np.dot(f_A, f_D_i) / n_samples - f_0_square) / total_variance
-                )
+        total_order_sobol = (est_1 + est_2) / 2
 
-                total_order_sobol[var_i, output_j] = (est_1 + est_2) / 2
+    else:
+        # unknown scheme
+        total_order_sobol = np.zeros((num_vars, n_outputs))
 
     return total_order_sobol
 
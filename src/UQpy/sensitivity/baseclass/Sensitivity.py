@@ -9,7 +9,6 @@ sensitivity classes:
 
 """
 
-import copy
 import numpy as np
 import scipy.stats
 
@@ -63,7 +62,8 @@ class Sensitivity:
         """
 
         self.runmodel_object.run(samples=samples, append_samples=False)
-        model_evals = copy.deepcopy(np.array(self.runmodel_object.qoi_list))
+        # np.array already copies qoi_list into a new buffer
+        model_evals = np.array(self.runmodel_object.qoi_list)
 
         return model_evals
 
@@ -72,8 +72,6 @@ class Sensitivity:
     def bootstrap_sample_generator_1D(samples: Union[NumpyFloatArray, NumpyIntArray]):
         """Generate bootstrap samples.
 
-        Generators are used to avoid copying the entire array.
-
         It will simply pick `N` random rows from the array.
 
         For example:
@@ -91,39 +89,29 @@ class Sensitivity:
             Generator for the bootstrap samples.
 
         """
-        n_samples = samples.shape[0]
-
-        while True:
-            _indices = np.random.randint(0, high=n_samples, size=n_samples)
-
-            yield samples[_indices]
+        return Sensitivity._bootstrap_sample_generator(samples, 0)
 
     @staticmethod
     @beartype
     def bootstrap_sample_generator_2D(samples: Union[NumpyFloatArray, NumpyIntArray]):
         """Generate bootstrap samples.
 
-        Generators are used to avoid copying the entire array.
+        The same `N` random rows are picked from all columns, so that
+        model evaluations of the same sample stay paired.
 
         For example:
         Let's say we have '3' random variables
         To pick bootstrap samples from f_C_i, we first
-        generate indices to pick values from each column
-        num_cols = 3
-        cols = [0, 1, 2]
-        _indices = [[3, 4, 8]
-                    [6, 1, 2]
-                    [0, 5, 7]
-                    [4, 1, 0]] (4x3)
-        elements from f_C_i will be picked column-wise:
-        f_C_i[_indices[:, 0], 0]
-        f_C_i[_indices[:, 1], 1] etc.
+        generate the indices of the rows
+        _indices = [3, 4, 8, 6]
+        and pick the rows from all columns:
+        f_C_i[_indices, :]
 
         **Inputs:**
 
         * **samples** (`ndarray`):
             Model evaluations for the samples.
-            Shape: `(n_samples, 1)`.
+            Shape: `(n_samples, num_vars)`.
 
         **Outputs:**
 
@@ -131,24 +119,13 @@ class Sensitivity:
             Generator for the bootstrap samples.
 
         """
-        n_samples = samples.shape[0]
-
-        num_cols = samples.shape[1]
-        cols = np.arange(num_cols)
-
-        while True:
-            # generate indices to pick N values from f_A, f_B and f_C_i
-            _indices = np.random.randint(0, high=n_samples, size=samples.shape)
-
-            yield samples[_indices, cols]
+        return Sensitivity._bootstrap_sample_generator(samples, 0)
 
     @staticmethod
     @beartype
     def bootstrap_sample_generator_3D(samples: Union[NumpyFloatArray, NumpyIntArray]):
         """Generate bootstrap samples.
 
-        Generators are used to avoid copying the entire array.
-
         For example:
         Let's say we a model with multiple outputs.
         We use the same approach as in the 2D
@@ -168,15 +145,16 @@ class Sensitivity:
             Generator for the bootstrap samples.
 
         """
-        n_samples = samples.shape[1]
-        array_shape = samples.shape[1:]
-        num_cols = samples.shape[2]
-        cols = np.arange(num_cols)
+        return Sensitivity._bootstrap_sample_generator(samples, 1)
+
+    @staticmethod
+    def _bootstrap_sample_generator(samples, axis):
+        n_samples = samples.shape[axis]
 
         while True:
-            _indices = np.random.randint(0, high=n_samples, size=array_shape)
+            _indices = np.random.randint(0, high=n_samples, size=n_samples)
 
-            yield samples[:, _indices, cols]
+            yield Sensitivity._bootstrap_batch(samples, axis, _indices)
 
     @beartype
     def bootstrapping(
@@ -228,82 +206,113 @@ class Sensitivity:
 
         ##################### STORAGE #####################
 
-        # store generators of the inputs for bootstrap sampling
-        input_generators = []
-
         # store the qoi computed using bootstrap samples
         bootstrapped_qoi = np.zeros((n_outputs, n_qois, num_bootstrap_samples))
 
         # store the confidence interval for each qoi
         confidence_interval_qoi = np.zeros((n_outputs, n_qois, 2))
 
-        self._create_generators(estimator_inputs, input_generators)
-
-        self._evaluate_boostrap_sample_qoi(bootstrapped_qoi, estimator, input_generators, kwargs, num_bootstrap_samples)
+        self._evaluate_boostrap_sample_qoi(bootstrapped_qoi, estimator, estimator_inputs, kwargs,
+                                           num_bootstrap_samples)
 
         confidence_interval_qoi = self._calculate_confidence_intervals(bootstrapped_qoi, confidence_interval_qoi,
                                                                        confidence_level, n_outputs, qoi_mean)
 
         return confidence_interval_qoi
 
-    def _evaluate_boostrap_sample_qoi(self, bootstrapped_qoi, estimator, input_generators, kwargs,
+    def _evaluate_boostrap_sample_qoi(self, bootstrapped_qoi, estimator, estimator_inputs, kwargs,
                                       num_bootstrap_samples):
+        # axis along which the samples of each input are stored
+        sample_axes = self._classify_estimator_inputs(estimator_inputs)
+
+        n_samples = next(input.shape[axis] for input, axis in zip(estimator_inputs, sample_axes)
+                         if axis is not None)
+
+        random_generator = self._bootstrap_random_generator()
+
+        # The bootstrap samples are gathered for blocks of replicates at once,
+        # bounding the size of the gathered inputs to ~2**22 entries.
+        sample_size = sum(input.size for input, axis in zip(estimator_inputs, sample_axes) if axis is not None)
+        block_size = max(1, 2 ** 22 // sample_size)
+
         # Compute the qoi for each bootstrap sample
-        for j in range(num_bootstrap_samples):
+        for block_start in range(0, num_bootstrap_samples, block_size):
+            n_block = min(block_size, num_bootstrap_samples - block_start)
+            block_indices = random_generator.integers(0, n_samples, size=(n_block, n_samples))
+
+            # the same rows are picked from all inputs, so that
+            # model evaluations of the same sample stay paired
+            batches = [self._bootstrap_batch(input, axis, block_indices)
+                       for input, axis in zip(estimator_inputs, sample_axes)]
+
+            for j in range(n_block):
+                args = []
+                for batch, axis in zip(batches, sample_axes):
+                    if axis is None:
+                        args.append(batch)
+                    elif axis == 0:
+                        args.append(batch[j])
+                    else:
+                        args.append(batch[:, j])
+
+                bootstrapped_qoi[:, :, block_start + j] = estimator(*args, **kwargs).T
 
-            # inputs to the estimator
-            args = []
+    @staticmethod
+    def _bootstrap_batch(input, axis, block_indices):
+        # Gather the bootstrap samples of a block of replicates with a single indexing
+        # operation. The replicates are stored along a new axis in place of `axis`, i.e.
+        # (n_block, n_samples, ...) for 2D inputs and (n_outputs, n_block, n_samples, num_vars)
+        # for 3D inputs.
+        if axis is None:
+            return input
+        elif axis == 0:
+            return input[block_indices]
+        else:
+            return input[:, block_indices]
+
+    def _bootstrap_random_generator(self):
+        if isinstance(self.random_state, int):
+            return np.random.default_rng(self.random_state)
+        # Seed from the legacy global state if no random_state is given,
+        # so that np.random.seed keeps the bootstrap reproducible.
+        random_state = np.random if self.random_state is None else self.random_state
+        return np.random.default_rng(random_state.randint(np.iinfo(np.int32).max))
+
+    @staticmethod
+    def _classify_estimator_inputs(estimator_inputs):
+        sample_axes = []
+        for i, input in enumerate(estimator_inputs):
+
+            if input is None:
+                sample_axes.append(None)
 
-            # generate samples
-            for gen_input in input_generators:
-                if gen_input is None:
-                    args.append(gen_input)
-                else:
-                    args.append(gen_input.__next__())
+            # Example: f_A, f_B or f_C_i of models with single output.
+            # Shape: `(n_samples, 1)` or `(n_samples, num_vars)`.
+            elif isinstance(input, np.ndarray) and input.ndim in (1, 2):
+                sample_axes.append(0)
 
-            bootstrapped_qoi[:, :, j] = estimator(*args, **kwargs).T
+            # Example: f_C_i or f_D_i of models with multiple outputs.
+            # Shape: `(n_outputs, n_samples, num_vars)`.
+            elif isinstance(input, np.ndarray) and input.ndim == 3:
+                sample_axes.append(1)
+
+            else:
+                raise ValueError(f"UQpy: estimator_inputs[{i}] should be either "
+                                 f"None or `ndarray` of dimension 1, 2 or 3")
+        return sample_axes
 
     def _calculate_confidence_intervals(self, bootstrapped_qoi, confidence_interval_qoi, confidence_level, n_outputs,
                                         qoi_mean):
         # Calculate confidence intervals
         delta = -scipy.stats.norm.ppf((1 - confidence_level) / 2)
-        for output_j in range(n_outputs):
-            # estimate the standard deviation using the bootstrap indices
-            std_qoi = np.std(bootstrapped_qoi[output_j, :, :], axis=1, ddof=1)
 
-            lower_bound = qoi_mean[:, output_j] - delta * std_qoi
-            upper_bound = qoi_mean[:, output_j] + delta * std_qoi
+        # estimate the standard deviation using the bootstrap samples
+        # Shape: `(n_outputs, n_qois)`
+        std_qoi = np.std(bootstrapped_qoi, axis=2, ddof=1)
 
-            confidence_interval_qoi[output_j, :, 0] = lower_bound
-            confidence_interval_qoi[output_j, :, 1] = upper_bound
+        confidence_interval_qoi[:, :, 0] = qoi_mean.T - delta * std_qoi
+        confidence_interval_qoi[:, :, 1] = qoi_mean.T + delta * std_qoi
         # For models with single output, return 2D array.
         if n_outputs == 1:
             confidence_interval_qoi = confidence_interval_qoi[0, :, :]
         return confidence_interval_qoi
-
-    def _create_generators(self, estimator_inputs, input_generators):
-        for i, input in enumerate(estimator_inputs):
-
-            if isinstance(input, np.ndarray):
-
-                # Example: f_A or f_B of models with single output.
-                # Shape: `(n_samples, 1)`.
-                if input.ndim == 2 and input.shape[1] == 1:
-                    input_generators.append(self.bootstrap_sample_generator_1D(input))
-
-                # Example: f_C_i or f_D_i of models with single output.
-                # Shape: `(n_samples, num_vars)`.
-                elif input.ndim == 2 and input.shape[1] > 1:
-                    input_generators.append(self.bootstrap_sample_generator_2D(input))
-
-                # Example: f_C_i or f_D_i of models with multiple outputs.
-                # Shape: `(n_outputs, n_samples, num_vars)`.
-                elif input.ndim == 3:
-                    input_generators.append(self.bootstrap_sample_generator_3D(input))
-
-            elif input is None:
-                input_generators.append(input)
-
-            else:
-                raise ValueError(f"UQpy: estimator_inputs[{i}] should be either "
-                                 f"None or `ndarray` of dimension 1, 2 or 3")
@@ -1,6 +1,6 @@
 import numpy as np
 import scipy.stats as stats
-from UQpy.utilities.ValidationTypes import RandomStateType
+from UQpy.utilities.ValidationTypes import RandomGeneratorType
 
 from UQpy.run_model.RunModel import RunModel
 
@@ -348,7 +348,7 @@ def calculate_gauss_quadrature_2d(n, zmax, zmin):
     return eta, w2d, xi
 
 
-def process_random_state(random_state: RandomStateType):
+def process_random_state(random_state: RandomGeneratorType):
     if isinstance(random_state, (int, type(None))):
         return np.random.RandomState(random_state)
     else:
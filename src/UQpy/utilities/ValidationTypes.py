@@ -4,6 +4,7 @@ import numpy as np
 from beartype.vale import Is
 
 RandomStateType = Union[None, int, np.random.RandomState]
+RandomGeneratorType = Union[RandomStateType, np.random.Generator]
 PositiveInteger = Annotated[int, Is[lambda number: number > 0]]
 PositiveFloat = Annotated[float, Is[lambda number: number > 0]]
 Numpy2DFloatArray = Annotated[
@@ -1,4 +1,3 @@
-import itertools
 from typing import Tuple
 
 import numpy as np
@@ -26,9 +25,8 @@ class GaussianKernel(EuclideanKernel):
         super().__init__(kernel_parameter=kernel_parameter)
 
     def calculate_kernel_matrix(self, x, s):
-        product = [self.element_wise_operation(point_pair)
-                   for point_pair in list(itertools.product(x, s))]
-        self.kernel_matrix = np.array(product).reshape(len(x), len(s))
+        d = self._pairwise_squared_distances(x, s)
+        self.kernel_matrix = np.exp(-d / (2 * self.kernel_parameter ** 2))
         return self.kernel_matrix
 
     def element_wise_operation(self, xi_j: Tuple) -> float:
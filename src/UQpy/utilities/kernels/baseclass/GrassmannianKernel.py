@@ -20,12 +20,57 @@ class GrassmannianKernel(Kernel, ABC):
     def calculate_kernel_matrix(self, x: list[GrassmannPoint], s: list[GrassmannPoint]):
         p = self.kernel_parameter
         list1 = [point.data if not p else point.data[:, :p] for point in x]
-        list2 = [point.data if not p else point.data[:, :p] for point in s]
-        product = [self.element_wise_operation(point_pair)
-                   for point_pair in list(itertools.product(list1, list2))]
-        self.kernel_matrix = np.array(product).reshape(len(list1), len(list2))
+        # the truncated points are computed once when both arguments are the same
+        list2 = list1 if x is s else [point.data if not p else point.data[:, :p] for point in s]
+        if len({point.shape for point in itertools.chain(list1, list2)}) == 1:
+            self.kernel_matrix = self.kernel_matrix_from_gram(self._pairwise_products(list1, list2, x is s))
+            if self.kernel_matrix is not None:
+                return self.kernel_matrix
+        if x is s:
+            self.kernel_matrix = self._symmetric_kernel_matrix(list1)
+            return self.kernel_matrix
+        self.kernel_matrix = np.empty((len(list1), len(list2)))
+        for i, xi in enumerate(list1):
+            for j, xj in enumerate(list2):
+                self.kernel_matrix[i, j] = self.element_wise_operation((xi, xj))
         return self.kernel_matrix
 
+    @staticmethod
+    def _pairwise_products(list1: list[np.ndarray], list2: list[np.ndarray], symmetric: bool) -> np.ndarray:
+        # All pairwise products xi.T @ xj from a single matrix product of the stacked
+        # points, shape (len(list1), len(list2), p, p). For x is s this is X.T @ X,
+        # which numpy evaluates as a symmetric rank-k update.
+        n_rows, p = list1[0].shape
+        x = np.stack(list1, axis=1).reshape(n_rows, -1)
+        s = x if symmetric else np.stack(list2, axis=1).reshape(n_rows, -1)
+        products = x.T @ s
+        return products.reshape(len(list1), p, len(list2), p).transpose(0, 2, 1, 3)
+
+    def _symmetric_kernel_matrix(self, points: list[np.ndarray]) -> np.ndarray:
+        # Evaluate the upper triangle only and mirror it, since k(xi, xj) = k(xj, xi).
+        n_points = len(points)
+        upper = np.triu_indices(n_points)
+        values = np.empty(len(upper[0]))
+        for k, (i, j) in enumerate(zip(*upper)):
+            values[k] = self.element_wise_operation((points[i], points[j]))
+        kernel_matrix = np.zeros((n_points, n_points))
+        kernel_matrix[upper] = values
+        kernel_matrix.T[upper] = values
+        return kernel_matrix
+
     @abstractmethod
     def element_wise_operation(self, xi_j: Tuple) -> float:
         pass
+
+    def kernel_matrix_from_gram(self, gram: np.ndarray) -> Union[np.ndarray, None]:
+        r"""
+        Compute the kernel matrix from the products of all pairs of Grassmann points.
+
+        Kernels whose entries depend only on :math:`\mathbf{X}_i^T\mathbf{X}_j` can override this method to
+        avoid the element-wise evaluation of :meth:`element_wise_operation` over all pairs of points. If it returns
+        :any:`None`, which is the default, the kernel matrix is computed with :meth:`element_wise_operation`.
+
+        :param gram: Array of shape :code:`(len(x), len(s), p, p)` whose :code:`[i, j]` entry is
+         :math:`\mathbf{X}_i^T\mathbf{X}_j`.
+        """
+        return None
@@ -38,3 +38,22 @@ class Kernel(ABC):
             np.swapaxes(np.atleast_3d(x_), 1, 2), (1, np.size(s_, 0), 1)
         ) - np.tile(s_, (np.size(x_, 0), 1, 1))
         return stack
+
+    @staticmethod
+    def _pairwise_squared_distances(x, s):
+        # Squared Euclidean distances between all pairs of flattened points, computed as
+        # ||x_i||^2 + ||s_j||^2 - 2 x_i^T s_j so that all inner products follow from a single
+        # matrix product (a symmetric rank-k update X X^T when x is s). The points are shifted
+        # by a common mean first, which leaves the distances unchanged but avoids cancellation
+        # for points far from the origin.
+        x_ = np.reshape(np.asarray(x, dtype=float), (len(x), -1))
+        center = x_.mean(axis=0)
+        x_ = x_ - center
+        s_ = x_ if s is x else np.reshape(np.asarray(s, dtype=float), (len(s), -1)) - center
+        x_norms = np.einsum('ij,ij->i', x_, x_)
+        s_norms = x_norms if s is x else np.einsum('ij,ij->i', s_, s_)
+        distances = x_norms[:, None] + s_norms[None, :] - 2 * (x_ @ s_.T)
+        if s is x:
+            np.fill_diagonal(distances, 0)
+        # round-off can make the distance of (nearly) identical points negative
+        return np.maximum(distances, 0)
@@ -20,3 +20,12 @@ class BinetCauchyKernel(GrassmannianKernel):
         r = np.dot(xi.T, xj)
         det = np.linalg.det(r)
         return det * det
+
+    def kernel_matrix_from_gram(self, gram: np.ndarray) -> np.ndarray:
+        """
+        Compute the Binet-Cauchy kernel matrix from the products of all pairs of points on the Grassmann manifold.
+
+        :param gram: Array of shape :code:`(len(x), len(s), p, p)` with the products of the grassmann points.
+        """
+        det = np.linalg.det(gram)
+        return det * det
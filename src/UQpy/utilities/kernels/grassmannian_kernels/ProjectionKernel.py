@@ -23,3 +23,11 @@ class ProjectionKernel(GrassmannianKernel):
         r = np.dot(xi.T, xj)
         n = np.linalg.norm(r, "fro")
         return n * n
+
+    def kernel_matrix_from_gram(self, gram: np.ndarray) -> np.ndarray:
+        """
+        Compute the Projection kernel matrix from the products of all pairs of points on the Grassmann manifold.
+
+        :param gram: Array of shape :code:`(len(x), len(s), p, p)` with the products of the grassmann points.
+        """
+        return np.einsum('ijpq,ijpq->ij', gram, gram)
@@ -3,6 +3,7 @@ from UQpy.utilities.GrassmannPoint import GrassmannPoint
 from UQpy.dimension_reduction.grassmann_manifold.projections.SVDProjection import SVDProjection
 from UQpy.utilities.kernels.grassmannian_kernels.BinetCauchyKernel import BinetCauchyKernel
 from UQpy.utilities.kernels.GaussianKernel import GaussianKernel
+from UQpy.utilities.kernels.baseclass.GrassmannianKernel import GrassmannianKernel
 import numpy as np
 
 
@@ -90,6 +91,17 @@ sol3 = np.array([[0.60547, 0.11492, 0.78956, 0.13796, 0.76685, 0.41661],
                  [0.56006, 0.16879, 1.09635, 0.20431, 0.69439, 0.60317]])
 
 
+def test_kernel_gaussian_offset_points():
+    rnd = np.random.RandomState(3)
+    x = 1e4 + 1e-3 * rnd.normal(size=(6, 3))
+    s = 1e4 + 1e-3 * rnd.normal(size=(4, 3))
+    gaussian = GaussianKernel(kernel_parameter=1e-3)
+    for points in [s, x]:
+        gaussian.calculate_kernel_matrix(x, points)
+        element_wise = np.squeeze([[gaussian.element_wise_operation((xi, xj)) for xj in points] for xi in x])
+        assert np.allclose(gaussian.kernel_matrix, element_wise, rtol=0, atol=1e-6)
+
+
 def test_kernel():
 
     np.random.seed(1111)  # For reproducibility.
@@ -104,3 +116,39 @@ def test_kernel():
     kernel.calculate_kernel_matrix(manifold_projection.u, manifold_projection.u)
 
     assert np.round(kernel.kernel_matrix[0, 1], 8) == 6.0
+
+
+def test_kernel_gram_form_matches_element_wise():
+    rnd = np.random.RandomState(0)
+    points = [GrassmannPoint(np.linalg.qr(rnd.normal(size=(6, 3)))[0]) for _ in range(5)]
+    for kernel in [ProjectionKernel(), BinetCauchyKernel()]:
+        kernel.calculate_kernel_matrix(points, points[:3])
+        element_wise = np.array([[kernel.element_wise_operation((xi.data, xj.data)) for xj in points[:3]]
+                                 for xi in points])
+        assert kernel.kernel_matrix.shape == (5, 3)
+        assert np.allclose(kernel.kernel_matrix, element_wise)
+
+
+def test_kernel_element_wise_symmetric():
+    class TraceKernel(GrassmannianKernel):
+        def element_wise_operation(self, xi_j):
+            xi, xj = xi_j
+            return np.trace(np.dot(xi.T, xj))
+
+    rnd = np.random.RandomState(1)
+    points = [GrassmannPoint(np.linalg.qr(rnd.normal(size=(6, 2)))[0]) for _ in range(4)]
+    kernel = TraceKernel()
+    kernel.calculate_kernel_matrix(points, points)
+    expected = np.array([[np.trace(xi.data.T @ xj.data) for xj in points] for xi in points])
+    assert np.allclose(kernel.kernel_matrix, expected)
+
+
+def test_kernel_element_wise_rectangular():
+    rnd = np.random.RandomState(2)
+    x = [GrassmannPoint(np.linalg.qr(rnd.normal(size=(5, 2)))[0]) for _ in range(3)]
+    s = [GrassmannPoint(np.linalg.qr(rnd.normal(size=(5, 3)))[0]) for _ in range(2)]
+    kernel = ProjectionKernel()
+    kernel.calculate_kernel_matrix(x, s)
+    expected = np.array([[np.linalg.norm(xi.data.T @ sj.data, "fro") ** 2 for sj in s] for xi in x])
+    assert kernel.kernel_matrix.shape == (3, 2)
+    assert np.allclose(kernel.kernel_matrix, expected)
@@ -2,7 +2,7 @@ import numpy as np
 import pytest
 from beartype.roar import BeartypeCallHintPepParamException
 
-from UQpy.distributions import Normal, MultivariateNormal
+from UQpy.distributions import Normal, Uniform, MultivariateNormal, JointIndependent
 from UQpy.sampling import MonteCarloSampling
 
 dist1 = Normal(loc=0., scale=1.)
@@ -160,3 +160,48 @@ def test_cdf_method3():
     z4.dist_object, z4.list = [1, 2], True
     with pytest.raises(ValueError):
         z4.transform_u01()
+
+
+def test_random_state_generator():
+    """Check that a np.random.Generator can be used as random_state."""
+    z6 = MonteCarloSampling(distributions=[dist1, dist2], nsamples=3, random_state=np.random.default_rng(123))
+    z6.run(nsamples=2, random_state=np.random.default_rng(123))
+    assert z6.samples.shape == (5, 2)
+    assert np.allclose(z6.samples[:3], np.random.default_rng(123).standard_normal((2, 3)).T)
+    assert np.allclose(z6.samples[3:], np.random.default_rng(123).standard_normal((2, 2)).T)
+
+
+def test_samples_update_parameters():
+    """Check the samples of Normal and Uniform distributions, when their parameters are updated between consecutive
+    calls of the 'run' method."""
+    dist4, dist5 = Normal(loc=1., scale=2.), Uniform(loc=-1., scale=3.)
+    z7 = MonteCarloSampling(distributions=[dist4, dist5], nsamples=3, random_state=123)
+    dist4.update_parameters(loc=-1.)
+    z7.run(nsamples=2, random_state=321)
+    rs1, rs2 = np.random.RandomState(123), np.random.RandomState(321)
+    expected_samples = np.vstack([np.hstack([Normal(loc=1., scale=2.).rvs(3, rs1), dist5.rvs(3, rs1)]),
+                                  np.hstack([dist4.rvs(2, rs2), dist5.rvs(2, rs2)])])
+    assert np.array_equal(z7.samples, expected_samples)
+
+
+def test_samples_replace_distribution():
+    """Check that a distribution replaced in the list of distributions is sampled by subsequent calls of the 'run'
+    method."""
+    distributions = [Normal(loc=0., scale=1.), Normal(loc=0., scale=1.)]
+    z8 = MonteCarloSampling(distributions=distributions, nsamples=2, random_state=123)
+    distributions[0] = Normal(loc=1000., scale=1.)
+    z8.run(nsamples=2, random_state=321)
+    rs = np.random.RandomState(321)
+    expected_samples = np.hstack([distributions[0].rvs(2, rs), distributions[1].rvs(2, rs)])
+    assert np.array_equal(z8.samples[2:], expected_samples)
+    assert (z8.samples[2:, 0] > 900).all()
+
+
+def test_transform_u01_joint_independent():
+    """Check that the samples of a JointIndependent distribution are transformed with the cdf of each marginal."""
+    marginals = [Normal(), Uniform()]
+    z9 = MonteCarloSampling(distributions=JointIndependent(marginals), nsamples=4, random_state=1)
+    z9.transform_u01()
+    expected_samples_u01 = np.column_stack([marginal.cdf(z9.samples[:, j]) for j, marginal in enumerate(marginals)])
+    assert np.allclose(z9.samplesU01, expected_samples_u01)
+    assert np.allclose(z9.samplesU01[0], [0.948, 0.397], atol=1e-3)
@@ -7,6 +7,12 @@ This module is used to test the functionalities of the baseclass.
     Test the bootstrap sampling for a vector.
 - test_bootstrap_for_matrix: 
     Test the bootstrap sampling for a matrix.
+- test_bootstrapping_shared_rows:
+    Test that the same rows are resampled from all estimator inputs, including 1D inputs.
+- test_bootstrapping_random_state:
+    Test the reproducibility of the bootstrap for an integer `random_state`.
+- test_bootstrapping_global_seed:
+    Test the reproducibility of the bootstrap with `np.random.seed`.
 
 """
 
@@ -166,16 +172,13 @@ def manual_bootstrap_samples_f_A():
 def manual_bootstrap_samples_f_C_i():
     """This function bootstraps the C_i-like vector using random indices"""
 
-    # Genrated using np.random.randint(low=0, high=5, size=(5,2))
+    # Genrated using np.random.randint(low=0, high=5, size=5)
     # with np.random.seed(12345)
-    # rand_indices_C_i = np.array([ [2, 1],
-    #                               [4, 1],
-    #                               [2, 1],
-    #                               [1, 3],
-    #                               [1, 3]])
+    # rand_indices_C_i = np.array([2, 1, 4, 1, 2])
+    # the same rows are picked from all columns
 
     bootstrap_f_C_i = np.array(
-        [[102, 201], [104, 201], [102, 201], [101, 203], [101, 203]]
+        [[102, 202], [101, 201], [104, 204], [101, 201], [102, 202]]
     )
 
     return bootstrap_f_C_i
@@ -232,3 +235,89 @@ def test_bootstrap_for_matrix(random_f_C_i, manual_bootstrap_samples_f_C_i):
 
     # Act
     assert np.array_equal(manual_bootstrap_samples_f_C_i, bootstrap_samples_C_i)
+
+
+def _bootstrap_estimator(recorded):
+    """Estimator that records its inputs and returns their means as QoIs."""
+
+    def estimator(*args):
+        recorded.append([None if arg is None else np.copy(arg) for arg in args])
+        return np.array([[0.0 if arg is None else np.mean(arg)] for arg in args])
+
+    return estimator
+
+
+def test_bootstrapping_shared_rows(sobol_object):
+
+    """Test that the same rows are resampled from all estimator inputs, including 1D inputs."""
+
+    # Prepare
+    sobol_object.random_state = 123
+    rows = np.arange(5.0)
+    f_A = rows.reshape(-1, 1)
+    f_C_i = np.column_stack([rows, rows + 100])
+    f_D_i = np.array([f_C_i, f_C_i + 1000])
+    recorded = []
+
+    # Act
+    sobol_object.bootstrapping(_bootstrap_estimator(recorded), [f_A, rows, None, f_C_i, f_D_i],
+                               np.zeros((5, 1)), num_bootstrap_samples=4)
+
+    # Assert
+    assert len(recorded) == 4
+    for bootstrap_f_A, bootstrap_rows, bootstrap_none, bootstrap_f_C_i, bootstrap_f_D_i in recorded:
+        picked = bootstrap_f_A[:, 0]
+        assert bootstrap_rows.shape == (5,)
+        assert np.array_equal(bootstrap_rows, picked)
+        assert bootstrap_none is None
+        assert np.array_equal(bootstrap_f_C_i, np.column_stack([picked, picked + 100]))
+        assert np.array_equal(bootstrap_f_D_i[0], bootstrap_f_C_i)
+        assert np.array_equal(bootstrap_f_D_i[1], bootstrap_f_C_i + 1000)
+
+
+def test_bootstrapping_random_state(sobol_object):
+
+    """Test the reproducibility of the bootstrap for an integer `random_state`."""
+
+    # Prepare
+    f_A = np.arange(20.0).reshape(-1, 1)
+
+    def interval(random_state):
+        sobol_object.random_state = random_state
+        return sobol_object.bootstrapping(_bootstrap_estimator([]), [f_A], np.zeros((1, 1)),
+                                          num_bootstrap_samples=10)
+
+    # Act
+    np.random.seed(1)
+    interval_1 = interval(123)
+    np.random.seed(2)
+    interval_2 = interval(123)
+
+    # Assert
+    assert np.array_equal(interval_1, interval_2)
+    assert not np.array_equal(interval_1, interval(321))
+
+
+def test_bootstrapping_global_seed(sobol_object):
+
+    """Test the reproducibility of the bootstrap with `np.random.seed`."""
+
+    # Prepare
+    sobol_object.random_state = None
+    f_A = np.arange(20.0).reshape(-1, 1)
+
+    def interval():
+        return sobol_object.bootstrapping(_bootstrap_estimator([]), [f_A], np.zeros((1, 1)),
+                                          num_bootstrap_samples=10)
+
+    # Act
+    np.random.seed(12345)
+    interval_1 = interval()
+    np.random.seed(12345)
+    interval_2 = interval()
+    np.random.seed(54321)
+    interval_3 = interval()
+
+    # Assert
+    assert np.array_equal(interval_1, interval_2)
+    assert not np.array_equal(interval_1, interval_3)